@@ -1,8 +1,17 @@
-import time
 import json
 import asyncio
+from types import MappingProxyType
 
-from futunn import MARKET_TYPE_US, RANK_TYPE_TOP_TURNOVER, FutunnClient
+from futunn import MARKET_TYPE_US, RANK_TYPE_TOP_TURNOVER, get_default_client, next_nonce
+
+# Query params shared by every kline request; only stockId and "_" vary per call
+_KLINE_PARAMS_TEMPLATE = MappingProxyType({
+    "marketType": "2",
+    "type": "2",
+    "marketCode": "11",
+    "instrumentType": "4",
+    "subInstrumentType": "4002",
+})
 
 
 async def main():
@@ -10,29 +19,31 @@ async def main():
 
     print("=== Futunn API Client - Basic Usage ===\n")
 
-    # Create client instance
-    async with FutunnClient() as client:
-        
-        params = {
-            "stockId": "203290",
-            "marketType": "2",
-            "type": "2",
-            "marketCode": "11",
-            "instrumentType": "4",
-            "subInstrumentType": "4002",
-            "_": str(int(time.time() * 1000))
-        }
-
-        # # Fetch stock list
-        # data = await client.get_stock_kline(
-        #     params=params
-        # )
-        
-        data = await client.get_stock_min_kline(
-            params=params
-        )
-
-        print(data)
+    # Reuse one shared client so repeated calls share the connection pool and tokens
+    client = get_default_client()
+
+    try:
+        # Poll the same stock several times; after the first call every request
+        # reuses the pooled connection and the cached csrf token
+        for _ in range(3):
+            params = {**_KLINE_PARAMS_TEMPLATE, "stockId": "203290", "_": next_nonce()}
+
+            # # Fetch stock list
+            # data = await client.get_stock_kline(
+            #     params=params
+            # )
+
+            data = await client.get_stock_min_kline(
+                params=params
+            )
+
+            print(data)
+
+            await asyncio.sleep(1)
+    finally:
+        # This script owns the process, so it closes the shared client on exit.
+        # Library code should leave that to the application instead.
+        await client.close()
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ Example:
     >>> asyncio.run(main())
 """
 
-from futunn.client import FutunnClient
+from futunn.client import FutunnClient, get_default_client, next_nonce
 from futunn.constants import (
     MARKET_TYPE_AU,
     MARKET_TYPE_CA,
@@ -40,6 +40,8 @@ __version__ = "0.1.0"
 __author__ = "Futunn Helper Contributors"
 __all__ = [
     "FutunnClient",
+    "get_default_client",
+    "next_nonce",
     "Stock",
     "StockList",
     "Pagination",
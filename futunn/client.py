@@ -6,8 +6,11 @@ Inspired by the Translator class from py-googletrans.
 """
 
 import asyncio
+import itertools
 import logging
+import time
 from collections.abc import Mapping
+from typing import Any
 
 import httpx
 
@@ -23,6 +26,8 @@ from futunn.token import TokenManager
 
 logger = logging.getLogger(__name__)
 
+_nonce_counter = itertools.count(int(time.time() * 1000))
+
 
 class FutunnClient:
     """
@@ -55,8 +60,13 @@ class FutunnClient:
             timeout: Request timeout in seconds (default: 10)
             concurrency_limit: Maximum concurrent requests (default: 5)
         """
-        client_kwargs = {
+        client_kwargs: dict[str, Any] = {
             "http2": True,
+            "limits": httpx.Limits(
+                max_keepalive_connections=constants.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=constants.DEFAULT_MAX_CONNECTIONS,
+                keepalive_expiry=constants.DEFAULT_KEEPALIVE_EXPIRY,
+            ),
             "timeout": timeout,
             "follow_redirects": True,
         }
@@ -167,7 +177,7 @@ class FutunnClient:
             return StockList.from_dict(data)
 
         except InvalidResponseError as e:
-            logger.error(f"Invalid response from API: {e}")
+            logger.error("Invalid response from API: %s", e)
             raise
 
     async def get_multiple_pages(
@@ -241,7 +251,7 @@ class FutunnClient:
         if max_pages:
             total_pages = min(total_pages, max_pages)
 
-        logger.info(f"Fetching {total_pages} pages of stocks")
+        logger.info("Fetching %d pages of stocks", total_pages)
 
         # Fetch remaining pages (we already have page 0)
         if total_pages > 1:
@@ -303,7 +313,7 @@ class FutunnClient:
         headers = await self.token_manager.get_headers(params=params, data=data)
 
         try:
-            logger.debug(f"Making request to {url} with params {params}")
+            logger.debug("Making request to %s with params %s", url, params)
 
             response = await self.client.get(url, params=params, headers=headers)
 
@@ -338,5 +348,54 @@ class FutunnClient:
                 )
 
         except httpx.RequestError as e:
-            logger.error(f"Network error: {e}")
+            logger.error("Network error: %s", e)
             raise FutunnAPIError(f"Network error: {e}")
+
+
+_default_client: FutunnClient | None = None
+_default_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_default_client() -> FutunnClient:
+    """
+    Return the shared FutunnClient for the running event loop, creating it on first use.
+
+    Reusing one client keeps the httpx connection pool, HTTP/2 session and
+    cached tokens alive across calls. Don't instantiate ``FutunnClient``
+    inside a hot loop; each new instance pays fresh TCP/TLS handshakes and a
+    token bootstrap request.
+
+    The client's connection pool and semaphore belong to one event loop, so a
+    new client is built when called from a different loop (e.g. a second
+    ``asyncio.run()``). Must be called from within a coroutine.
+
+    Example:
+        >>> client = get_default_client()
+        >>> for params in batch:
+        >>>     data = await client.get_stock_min_kline(params=params)
+    """
+    global _default_client, _default_client_loop
+    loop = asyncio.get_running_loop()
+    client = _default_client
+    if (
+        client is None
+        or client.client is None
+        or client.client.is_closed
+        or _default_client_loop is not loop
+    ):
+        client = _default_client = FutunnClient()
+        _default_client_loop = loop
+    return client
+
+
+def next_nonce() -> str:
+    """
+    Return a unique, monotonically increasing cache-buster for the ``_`` query param.
+
+    Seeded from the wall clock in milliseconds at import, then incremented per
+    call, so values never collide within the same millisecond.
+
+    Example:
+        >>> params = {"stockId": "203290", "_": next_nonce()}
+    """
+    return str(next(_nonce_counter))
@@ -31,6 +31,11 @@ DEFAULT_PAGE_SIZE = 50
 DEFAULT_TIMEOUT = 10
 DEFAULT_CONCURRENCY_LIMIT = 5
 
+# Connection Pool
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_MAX_CONNECTIONS = 64
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
 # User Agent
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -5,6 +5,7 @@ Handles acquisition and management of authentication tokens required for API req
 Inspired by TokenAcquirer from py-googletrans.
 """
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -19,6 +20,33 @@ from futunn.exceptions import TokenExpiredError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; matches e.g. ``"csrfToken": "..."`` in inline page scripts.
+# Quantifiers are bounded to keep backtracking cheap on pathological input.
+_CSRF_RE = re.compile(
+    rb'csrf[_-]?token["\']?\s{0,16}[:=]\s{0,16}["\']([^"\'\s]{1,512})["\']',
+    re.IGNORECASE,
+)
+# Upper bound on a full _CSRF_RE match, used as overlap between streamed chunks
+_CSRF_MATCH_MAX = 1024
+_STREAM_CHUNK_SIZE = 8192
+# Unread bodies up to this size are drained so HTTP/1.1 connections go back to the pool
+_DRAIN_MAX_BYTES = 64 * 1024
+
+# Browser-like headers for the token bootstrap page visit
+_BOOTSTRAP_HEADERS = {
+    "User-Agent": constants.DEFAULT_USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Request headers that never change within a process, pre-encoded so httpx
+# does not re-encode them on every request
+_STATIC_HEADER_ITEMS: list[tuple[bytes, bytes]] = [
+    (b"referer", urls.STOCK_LIST_PAGE.encode()),
+    (b"user-agent", constants.DEFAULT_USER_AGENT.encode()),
+    (b"accept", b"application/json, text/plain, */*"),
+]
+
 
 class TokenManager:
     """
@@ -27,6 +55,14 @@ class TokenManager:
     Fetches and caches tokens from cookies and headers when visiting the main page.
     """
 
+    __slots__ = (
+        "client",
+        "csrf_token",
+        "_headers_cache",
+        "_headers_csrf_token",
+        "_fetch_task",
+    )
+
     def __init__(self, client: httpx.AsyncClient):
         """
         Initialize TokenManager
@@ -36,24 +72,33 @@ class TokenManager:
         """
         self.client = client
         self.csrf_token: str | None = None
+        self._headers_cache: list[tuple[bytes, bytes]] | None = None
+        self._headers_csrf_token: str | None = None
+        self._fetch_task: asyncio.Task[None] | None = None
 
     async def get_headers(
         self,
         *,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
-    ) -> dict[str, str]:
+    ) -> list[tuple[bytes, bytes]]:
         """
         Get authentication tokens, fetching new ones if necessary.
 
         Returns:
-            Dict containing required headers with tokens
+            List of pre-encoded ``(name, value)`` header pairs with tokens
 
         Raises:
             TokenExpiredError: If unable to fetch tokens
         """
         if self.csrf_token is None:
-            await self._fetch_tokens()
+            # Concurrent callers on a cold cache share a single bootstrap request
+            # and all see its result, including any error it raises
+            fetch = self._fetch_task
+            if fetch is None:
+                fetch = self._fetch_task = asyncio.ensure_future(self._fetch_tokens())
+                fetch.add_done_callback(self._clear_fetch_task)
+            await asyncio.shield(fetch)
 
         csrf_token = self._read_csrf_cookie()
         if not csrf_token:
@@ -64,45 +109,58 @@ class TokenManager:
 
         return self._build_headers(csrf_token=csrf_token, quote_token=quote_token)
 
+    def _clear_fetch_task(self, task: asyncio.Task[None]) -> None:
+        if self._fetch_task is task:
+            self._fetch_task = None
+
     async def _fetch_tokens(self) -> None:
         """
         Fetch tokens by visiting the main Futunn page.
 
-        This mimics a browser visit to extract cookies and tokens.
+        This mimics a browser visit to extract cookies and tokens. The body is
+        streamed and only read when the token is not in cookies or headers.
+        Closing an unread HTTP/1.1 response drops its connection rather than
+        returning it to the pool, so bodies with a known small length are
+        drained first; larger pages trade that connection for not downloading
+        the whole page. HTTP/2 streams are unaffected.
         """
         try:
             logger.info("Fetching authentication tokens from Futunn")
 
-            # Visit the main stock list page to get cookies
-            response = await self.client.get(
+            # Visit the main stock list page to get cookies; the body is only
+            # streamed as far as needed when the token is not in cookies/headers
+            async with self.client.stream(
+                "GET",
                 urls.STOCK_LIST_PAGE,
-                headers={
-                    "User-Agent": constants.DEFAULT_USER_AGENT,
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                },
+                headers=_BOOTSTRAP_HEADERS,
                 follow_redirects=True,
-            )
+            ) as response:
+                if response.status_code != 200:
+                    raise TokenExpiredError(
+                        f"Failed to fetch tokens: HTTP {response.status_code}"
+                    )
 
-            if response.status_code != 200:
-                raise TokenExpiredError(
-                    f"Failed to fetch tokens: HTTP {response.status_code}"
-                )
+                self.csrf_token = await self._extract_csrf_token(response, response.cookies)
 
-            self.csrf_token = self._extract_csrf_token(response, response.cookies)
+                if not response.is_stream_consumed and response.http_version != "HTTP/2":
+                    length = response.headers.get("content-length", "")
+                    if length.isdigit() and int(length) <= _DRAIN_MAX_BYTES:
+                        await response.aread()
 
             logger.info("Successfully fetched csrf token")
 
         except httpx.RequestError as e:
-            logger.error(f"Network error while fetching tokens: {e}")
+            logger.error("Network error while fetching tokens: %s", e)
             raise TokenExpiredError(f"Network error: {e}")
 
-    def _extract_csrf_token(self, response: httpx.Response, cookies: httpx.Cookies) -> str:
+    async def _extract_csrf_token(
+        self, response: httpx.Response, cookies: httpx.Cookies
+    ) -> str:
         """
         Extract CSRF token from response.
 
         Args:
-            response: HTTP response object
+            response: Streaming HTTP response object (body not yet read)
             cookies: Cookies from response
 
         Returns:
@@ -117,44 +175,87 @@ class TokenManager:
         if csrf_token:
             return csrf_token
 
+        # Fall back to any differently-named csrf cookie or header before scanning the body
+        for cookie in cookies.jar:
+            if cookie.value and "csrf" in cookie.name.lower():
+                return cookie.value
+
+        for name, value in response.headers.items():
+            if value and "csrf" in name.lower():
+                return value
+
         # Try to find in page content
-        content = response.text
-        match = re.search(r'csrf[_-]?token["\']\s*[:=]\s*["\']([^"\']+)["\']', content)
-        if match:
-            return match.group(1)
+        csrf_token = await self._scan_csrf_token(response)
+        if csrf_token:
+            return csrf_token
 
         raise TokenExpiredError("Unable to extract CSRF token from Futunn page")
 
-    def _build_headers(self, *, csrf_token: str, quote_token: str) -> dict[str, str]:
+    @staticmethod
+    async def _scan_csrf_token(response: httpx.Response) -> str | None:
+        """
+        Stream the page body until a CSRF token is found.
+
+        Stops reading as soon as a match is seen, so the rest of the page is
+        never downloaded. Only a short tail of earlier data is kept and
+        scanned together with each new chunk, so matches spanning chunk
+        boundaries are not missed while memory stays bounded.
+        """
+        buf = bytearray()
+        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+            buf.extend(chunk)
+
+            # Cheap case-insensitive pre-check; _CSRF_RE is compiled with IGNORECASE,
+            # which disables sre's fast literal-prefix search on non-matching input
+            if b"csrf" in buf.lower():
+                match = _CSRF_RE.search(buf)
+                if match:
+                    return match.group(1).decode("ascii", "replace")
+
+            # Only a match straddling the next chunk boundary can still need these bytes
+            del buf[:-_CSRF_MATCH_MAX]
+
+        return None
+
+    def _build_headers(
+        self, *, csrf_token: str, quote_token: str
+    ) -> list[tuple[bytes, bytes]]:
         """
         Build request headers with authentication tokens.
 
+        The csrf-dependent part is cached until the token changes or is
+        invalidated; only the per-request quote token is filled in per call.
+
         Returns:
-            Dictionary of headers
+            List of pre-encoded ``(name, value)`` header pairs
         """
-        return {
-            "futu-x-csrf-token": csrf_token,
-            "quote-token": quote_token,
-            "referer": urls.STOCK_LIST_PAGE,
-            "user-agent": constants.DEFAULT_USER_AGENT,
-            "accept": "application/json, text/plain, */*",
-        }
-
-    async def refresh_tokens(self) -> dict[str, str]:
+        cached = self._headers_cache
+        if cached is None or csrf_token != self._headers_csrf_token:
+            self._headers_csrf_token = csrf_token
+            cached = self._headers_cache = [
+                (b"futu-x-csrf-token", csrf_token.encode()),
+                *_STATIC_HEADER_ITEMS,
+            ]
+
+        return cached + [(b"quote-token", quote_token.encode())]
+
+    async def refresh_tokens(self) -> list[tuple[bytes, bytes]]:
         """
         Force refresh of authentication tokens.
 
         Returns:
-            Dict containing refreshed headers with tokens
+            List of pre-encoded header pairs with refreshed tokens
         """
         logger.info("Refreshing authentication tokens")
         self.csrf_token = None
+        self._headers_cache = None
         return await self.get_headers()
 
     def invalidate(self) -> None:
         """Invalidate cached tokens, forcing refresh on next request"""
         logger.info("Invalidating cached tokens")
         self.csrf_token = None
+        self._headers_cache = None
         self.client.cookies.clear()
 
     def _read_csrf_cookie(self) -> str | None:
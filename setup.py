@@ -35,7 +35,7 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "httpx>=0.27.0",
+        "httpx[http2]>=0.27.0",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,55 @@
+"""Tests for FutunnClient module-level helpers."""
+
+import asyncio
+
+import pytest
+
+from futunn import get_default_client, next_nonce
+
+
+async def _contend(client) -> None:
+    async def hold() -> None:
+        async with client._semaphore:
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(hold() for _ in range(client.concurrency_limit * 2)))
+
+
+async def test_default_client_is_shared_within_loop():
+    client = get_default_client()
+
+    assert get_default_client() is client
+    await client.close()
+
+
+async def test_default_client_rebuilt_after_close():
+    client = get_default_client()
+    await client.close()
+
+    assert get_default_client() is not client
+    await get_default_client().close()
+
+
+def test_default_client_rebuilt_for_new_event_loop():
+    async def use_default_client():
+        client = get_default_client()
+        await _contend(client)
+        return client
+
+    first = asyncio.run(use_default_client())
+    second = asyncio.run(use_default_client())
+
+    assert second is not first
+    asyncio.run(second.close())
+
+
+def test_default_client_requires_running_loop():
+    with pytest.raises(RuntimeError):
+        get_default_client()
+
+
+def test_next_nonce_strictly_increasing_and_unique():
+    values = [int(next_nonce()) for _ in range(1000)]
+
+    assert all(later > earlier for earlier, later in zip(values, values[1:]))
+    assert len(set(values)) == len(values)
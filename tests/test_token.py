@@ -0,0 +1,157 @@
+"""Tests for TokenManager token acquisition."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from futunn import urls
+from futunn.exceptions import TokenExpiredError
+from futunn.token import _CSRF_MATCH_MAX, _STREAM_CHUNK_SIZE, TokenManager
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    """Async byte stream that yields fixed chunks and counts how many were read."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.chunks_read = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
+def make_manager(handler) -> TokenManager:
+    return TokenManager(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def page_response(chunks: list[bytes], **kwargs) -> tuple[httpx.Response, ChunkedStream]:
+    stream = ChunkedStream(chunks)
+    return httpx.Response(200, stream=stream, **kwargs), stream
+
+
+def csrf_header(headers) -> str:
+    return dict(headers)[b"futu-x-csrf-token"].decode()
+
+
+async def test_token_spanning_chunk_boundary():
+    marker = b'{"csrfToken": "abcdefgh12345678"}'
+    split = _STREAM_CHUNK_SIZE - 10
+    body = b"a" * split + marker + b"z" * 20000
+    response, _ = page_response([body[i : i + 1000] for i in range(0, len(body), 1000)])
+    manager = make_manager(lambda request: response)
+
+    headers = await manager.get_headers()
+
+    assert csrf_header(headers) == "abcdefgh12345678"
+
+
+async def test_token_after_trimmed_tail():
+    body = b"x" * (_STREAM_CHUNK_SIZE * 5 + _CSRF_MATCH_MAX) + b'cSrF_token = "tok-after-tail"'
+    response, stream = page_response([body, b"y" * 50000, b"never read"])
+    manager = make_manager(lambda request: response)
+
+    headers = await manager.get_headers()
+
+    assert csrf_header(headers) == "tok-after-tail"
+    assert stream.chunks_read < len(stream.chunks)
+
+
+async def test_page_without_token_raises():
+    response, _ = page_response([b"<html>" + b"n" * 30000 + b"</html>"])
+    manager = make_manager(lambda request: response)
+
+    with pytest.raises(TokenExpiredError, match="Unable to extract CSRF token"):
+        await manager.get_headers()
+
+
+async def test_non_200_bootstrap_raises():
+    manager = make_manager(lambda request: httpx.Response(500, text="boom"))
+
+    with pytest.raises(TokenExpiredError, match="HTTP 500"):
+        await manager.get_headers()
+
+
+async def test_cookie_token_skips_body():
+    response, stream = page_response(
+        [b"<html>", b'{"csrfToken": "from-body-value"}'],
+        headers={"set-cookie": "csrfToken=from-cookie; Domain=www.futunn.com; Path=/"},
+    )
+    manager = make_manager(lambda request: response)
+
+    headers = await manager.get_headers()
+
+    assert csrf_header(headers) == "from-cookie"
+    assert stream.chunks_read == 0
+
+
+async def test_cookie_token_drains_small_body():
+    body = b"<html>small</html>"
+    response, stream = page_response(
+        [body],
+        headers={
+            "set-cookie": "csrfToken=from-cookie; Domain=www.futunn.com; Path=/",
+            "content-length": str(len(body)),
+        },
+    )
+    manager = make_manager(lambda request: response)
+
+    await manager.get_headers()
+
+    assert stream.chunks_read == 1
+
+
+async def test_bootstrap_targets_stock_list_page():
+    seen: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return httpx.Response(200, content=b'{"csrfToken": "abcdefgh"}')
+
+    manager = make_manager(handler)
+    await manager.get_headers()
+
+    assert seen == [httpx.URL(urls.STOCK_LIST_PAGE)]
+
+
+async def test_concurrent_cold_calls_share_one_bootstrap():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b'{"csrfToken": "abcdefgh"}')
+
+    manager = make_manager(handler)
+
+    results = await asyncio.gather(*(manager.get_headers() for _ in range(10)))
+
+    assert calls == 1
+    assert {csrf_header(headers) for headers in results} == {"abcdefgh"}
+
+
+async def test_concurrent_cold_calls_all_see_fetch_error():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(503)
+
+    manager = make_manager(handler)
+
+    results = await asyncio.gather(
+        *(manager.get_headers() for _ in range(10)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, TokenExpiredError) for result in results)
+
+    # A later call starts a fresh bootstrap instead of reusing the failed one
+    with pytest.raises(TokenExpiredError):
+        await manager.get_headers()
+    assert calls == 2